@@ -8,7 +8,16 @@ Usage:
     --marks-file trademarks_us_2025_text_only.json \
     --out runs/out \
     --concurrency 4 --rps 2 \
-    --save-flagged-screenshots
+    --save-flagged-screenshots \
+    [--processes 2] [--user-data-dir .pw-cache]
+
+Options:
+- --concurrency / --rps are totals for the whole run (pages open at once,
+  requests per second).
+- --processes N splits the URLs across N browser processes (capped at
+  --concurrency and the URL count); concurrency and rps are shared between them.
+- --user-data-dir is the Chromium profile reused across runs for a warm HTTP
+  cache (default .pw-cache; one subdirectory per process with --processes).
 
 Inputs:
 - CSV with a column named "url".
@@ -37,23 +46,33 @@ import argparse
 import asyncio
 import csv
 import json
+import multiprocessing
 import os
+import shutil
+import urllib.parse
 from datetime import datetime
 from html import escape as html_escape
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional, TextIO, Tuple
 
-import pandas as pd
-from playwright.async_api import async_playwright, Browser, Page
+from aiolimiter import AsyncLimiter
+from playwright.async_api import async_playwright, BrowserContext, Page
 
-import re
+try:
+    import orjson  # optional: much faster JSON Lines encoding/decoding
+except ImportError:
+    orjson = None
 
 
 # -----------------------------
 # Input loaders
 # -----------------------------
 def read_urls(csv_path: str) -> List[str]:
-    """Read a list of URLs from a CSV file with column 'url'."""
+    """
+    Read a list of URLs from a CSV file with column 'url'.
+    Duplicates are dropped and URLs are grouped by host (keeping file order
+    within a host) so consecutive visits reuse Chromium's connections.
+    """
     urls: List[str] = []
     with open(csv_path, newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
@@ -63,7 +82,8 @@ def read_urls(csv_path: str) -> List[str]:
             u = (row.get("url") or "").strip()
             if u:
                 urls.append(u)
-    return urls
+    unique = list(dict.fromkeys(urls))
+    return sorted(unique, key=lambda u: urllib.parse.urlsplit(u).netloc.lower())
 
 
 def read_marks(json_path: str) -> List[Dict[str, Any]]:
@@ -75,12 +95,13 @@ def read_marks(json_path: str) -> List[Dict[str, Any]]:
         term = str(m.get("term", "")).strip()
         if not term:
             continue
+        case_insensitive = bool(m.get("case_insensitive", True))
         marks.append(
             {
                 "term": term,
                 "symbol": str(m.get("symbol", "")).strip(),
                 "variants": m.get("variants", []) or [],
-                "case_insensitive": bool(m.get("case_insensitive", True)),
+                "case_insensitive": case_insensitive,
                 "policy": m.get("policy", "first_prominent_only"),
                 "locales": m.get("locales", []) or ["en-US"],
             }
@@ -91,62 +112,168 @@ def read_marks(json_path: str) -> List[Dict[str, Any]]:
 # -----------------------------
 # DOM evaluation helpers
 # -----------------------------
-async def evaluate_prominent_elements(page: Page) -> List[Dict[str, str]]:
-    """
-    Return candidate nodes for prominent text as dicts:
-    {text, path, html}. Order implies priority.
-    """
-    script = """
-    () => {
-      function isVisible(el) {
-        const style = window.getComputedStyle(el);
-        if (style.visibility === 'hidden' || style.display === 'none') return false;
-        const rect = el.getBoundingClientRect();
-        return (rect.width > 0 && rect.height > 0);
+# The candidate collector is registered once on the browser context as an init
+# script (see run_audit), which defines it in each top-level document before page
+# scripts run (subframes skip it). Each URL then only sends a one-line call plus
+# the marks over CDP.
+COLLECTOR_SCRIPT = """
+(() => {
+  // Init scripts run in every frame; only the top-level document is audited.
+  if (window !== window.top) return;
+
+  window.__vtmCollect = (marks, tag) => {
+    // The flagged-element marker is only written when a screenshot will use it,
+    // and any marker left from an earlier (same-document) run is cleared first.
+    const FLAG_ATTR = 'data-vtm-flagged';
+    if (tag) document.querySelectorAll('[' + FLAG_ATTR + ']').forEach(el => el.removeAttribute(FLAG_ATTR));
+
+    function isVisible(el) {
+      const style = window.getComputedStyle(el);
+      if (style.visibility === 'hidden' || style.display === 'none') return false;
+      const rect = el.getBoundingClientRect();
+      return (rect.width > 0 && rect.height > 0);
+    }
+    const root = document.querySelector('main') || document.body;
+
+    // Exact-token match: not preceded/followed by letters/digits. Matching runs on
+    // the original text (as the old Python re.search did), so offsets always index
+    // it correctly; toLowerCase() can change a string's length.
+    const escapeRe = (s) => s.replace(/[\\\\^$.*+?()[\\]{}|\\/]/g, '\\\\$&');
+    const patterns = marks.map(mark => new RegExp(
+      '(?<![A-Za-z0-9])' + escapeRe(mark.term) + '(?![A-Za-z0-9])',
+      mark.case_insensitive ? 'iu' : 'u'
+    ));
+    const findTermEnd = (text, pattern) => {
+      const m = pattern.exec(text);
+      return m ? m.index + m[0].length : -1;
+    };
+
+    // Cheap pre-check: a mark can only match a candidate if its term occurs
+    // somewhere under root. Most pages mention few (or none) of the marks.
+    const rootText = root.textContent || '';
+    const present = [];
+    patterns.forEach((pattern, markIdx) => {
+      if (pattern.test(rootText)) present.push(markIdx);
+    });
+    if (!present.length) return [];
+
+    // Prefer headings, then hero/title classes, then early body copy.
+    // One traversal buckets elements by priority group; each bucket keeps document order.
+    const HEADINGS = ['H1', 'H2', 'H3'];
+    const TITLE_CLASSES = ['hero', 'product-title', 'page-intro', 'pdp-title', 'tile-title'];
+    const groupOf = (el) => {
+      const h = HEADINGS.indexOf(el.tagName);
+      if (h !== -1) return h;
+      const c = TITLE_CLASSES.findIndex(cls => el.classList.contains(cls));
+      return c === -1 ? -1 : HEADINGS.length + c;
+    };
+    const groups = Array.from({ length: HEADINGS.length + TITLE_CLASSES.length }, () => []);
+    const textNodes = [];
+    root.querySelectorAll('h1,h2,h3,.hero,.product-title,.page-intro,.pdp-title,.tile-title,p,li').forEach(el => {
+      const g = groupOf(el);
+      if (g !== -1) groups[g].push(el);
+      if (el.tagName === 'P' || el.tagName === 'LI') textNodes.push(el);
+    });
+
+    // Candidates are produced lazily in priority order, so visibility (style +
+    // layout) is only checked until every present mark has been resolved.
+    function* candidates() {
+      for (const group of groups) {
+        for (const el of group) if (isVisible(el)) yield el;
       }
-      const root = document.querySelector('main') || document.body;
-
-      const candidates = [];
-      const addAll = (selector) => {
-        root.querySelectorAll(selector).forEach(el => { if (isVisible(el)) candidates.push(el); });
-      };
-
-      // Prefer headings, then hero/title classes, then early body copy.
-      ['h1','h2','h3'].forEach(sel => addAll(sel));
-      ['.hero','.product-title','.page-intro','.pdp-title','.tile-title'].forEach(sel => addAll(sel));
-
       // First visible <p> or <li> in main
-      const textNodes = Array.from(root.querySelectorAll('p, li'));
       for (const el of textNodes) {
-        if (isVisible(el)) { candidates.push(el); break; }
+        if (isVisible(el)) { yield el; return; }
       }
+    }
 
-      const buildPath = (el) => {
-        const parts = [];
-        let node = el;
-        while (node && node.nodeType === Node.ELEMENT_NODE) {
-          let part = node.tagName.toLowerCase();
-          if (node.id) part += '#' + node.id;
-          if (node.classList && node.classList.length) part += '.' + Array.from(node.classList).join('.');
-          parts.unshift(part);
-          node = node.parentElement;
+    // Paths are memoized per element so shared ancestors are only stringified once.
+    // Class lists are capped at 3; the report clips paths to 140 chars anyway.
+    const pathCache = new WeakMap();
+    const buildPath = (el) => {
+      if (!el || el.nodeType !== Node.ELEMENT_NODE) return '';
+      if (pathCache.has(el)) return pathCache.get(el);
+      let part = el.tagName.toLowerCase();
+      if (el.id) part += '#' + el.id;
+      if (el.classList && el.classList.length) part += '.' + Array.from(el.classList).slice(0, 3).join('.');
+      const parentPath = buildPath(el.parentElement);
+      const path = parentPath ? parentPath + ' > ' + part : part;
+      pathCache.set(el, path);
+      return path;
+    };
+
+    // Skip separators after the term and capture the next character (a whole code
+    // point, hence the u flag), in one sticky match.
+    const SEP_THEN_CHAR = /[ \\t\\r\\n\\u00A0.\\-\\u2013\\u2014:,]*(.?)/ysu;
+
+    const unresolved = new Set(present);
+    const hits = [];
+    for (const el of candidates()) {
+      const text = el.textContent || '';
+      for (const markIdx of unresolved) {
+        const mark = marks[markIdx];
+        const end = findTermEnd(text, patterns[markIdx]);
+        if (end === -1) continue;
+        unresolved.delete(markIdx);  // only the first prominent occurrence for this mark
+
+        // First prominent occurrence → check the symbol immediately after the term
+        SEP_THEN_CHAR.lastIndex = end;
+        const actual = SEP_THEN_CHAR.exec(text)[1];
+
+        if (actual !== mark.symbol) {  // correct → no finding
+          // Tag the first flagged element so a screenshot can re-locate it.
+          if (tag && !hits.length) el.setAttribute(FLAG_ATTR, '');
+          hits.push({
+            mark_idx: markIdx,
+            status: (actual === '\u00AE' || actual === '\u2122') ? 'wrong symbol' : 'missing symbol',
+            actual_symbol: actual,
+            path: buildPath(el),
+            // Cut by code points so an astral character is never split into a lone surrogate.
+            snippet: Array.from(text.trim()).slice(0, 300).join('')
+          });
         }
-        return parts.join(' > ');
-      };
-
-      return candidates.map(el => ({
-        text: el.textContent || '',
-        path: buildPath(el),
-        html: el.innerHTML || ''
-      }));
+      }
+      if (!unresolved.size) break;
     }
+    // Report in mark order, as before.
+    hits.sort((a, b) => a.mark_idx - b.mark_idx);
+    return hits;
+  };
+})();
+"""
+
+
+async def evaluate_prominent_elements(
+    page: Page, marks: List[Dict[str, Any]], tag: bool = False
+) -> List[Dict[str, Any]]:
     """
-    return await page.evaluate(script)
+    Search prominent text for each mark inside the page and return only the
+    flagged first occurrences as dicts:
+    {mark_idx, status, actual_symbol, path, snippet}.
+    With tag, the first flagged element is marked for flagged_element_clip.
+    Requires COLLECTOR_SCRIPT to be registered as an init script.
+    """
+    return await page.evaluate("([marks, tag]) => window.__vtmCollect(marks, tag)", [marks, tag])
 
 
-def find_first_term(text: str, term: str, case_insensitive: bool) -> int:
-    """Return index of first occurrence of term (or -1)."""
-    return (text.lower().find(term.lower()) if case_insensitive else text.find(term))
+async def flagged_element_clip(page: Page, padding: int = 16) -> Optional[Dict[str, float]]:
+    """
+    Scroll the first flagged element into view and return its viewport
+    bounding box (padded) for use as a screenshot clip, or None.
+    """
+    script = """
+    (padding) => {
+      const el = document.querySelector('[data-vtm-flagged]');
+      if (!el) return null;
+      el.scrollIntoView({ block: 'center' });
+      const rect = el.getBoundingClientRect();
+      if (!(rect.width > 0 && rect.height > 0)) return null;
+      const x = Math.max(0, rect.left - padding);
+      const y = Math.max(0, rect.top - padding);
+      return { x, y, width: rect.right + padding - x, height: rect.bottom + padding - y };
+    }
+    """
+    return await page.evaluate(script, padding)
 
 
 # -----------------------------
@@ -173,7 +300,7 @@ async def process_url(
         return findings
 
     try:
-        candidates = await evaluate_prominent_elements(page)
+        hits = await evaluate_prominent_elements(page, marks, tag=save_screenshot)
     except Exception as exc:
         findings.append(
             {
@@ -183,65 +310,30 @@ async def process_url(
         )
         return findings
 
-    page_has_issue = False
-
-    # Only emit a finding if the term occurs in prominent text AND the symbol is wrong/missing.
-    for mark in marks:
-        term   = mark["term"]
-        symbol = mark["symbol"]
-        ci     = mark.get("case_insensitive", True)
-
-        # Build an exact-token regex: not preceded/followed by letters/digits.
-        term_escaped = re.escape(term)
-        pattern = rf"(?<![A-Za-z0-9]){term_escaped}(?![A-Za-z0-9])"
-        flags = re.IGNORECASE if ci else 0
-
-        for candidate in candidates:
-            text = candidate["text"] or ""
-            m = re.search(pattern, text, flags)
-            if not m:
-                continue
-
-            # Found first prominent occurrence → check the symbol immediately after the term
-            end = m.end()
-            actual_symbol = ""
-            j = end
-            while j < len(text) and text[j] in " \t\r\n\u00A0.-–—:,":
-                j += 1
-            if j < len(text):
-                actual_symbol = text[j]
-
-            if actual_symbol == symbol:
-                # Correct → no finding
-                pass
-            elif actual_symbol in ["®", "™"] and actual_symbol != symbol:
-                findings.append(
-                    {
-                        "url": url, "term": term, "issue": "wrong symbol",
-                        "expected": symbol, "found": actual_symbol,
-                        "path": candidate["path"], "snippet": (text.strip()[:300]), "details": "",
-                    }
-                )
-                page_has_issue = True
-            else:
-                findings.append(
-                    {
-                        "url": url, "term": term, "issue": "missing symbol",
-                        "expected": symbol, "found": actual_symbol or "",
-                        "path": candidate["path"], "snippet": (text.strip()[:300]), "details": "",
-                    }
-                )
-                page_has_issue = True
-
-            break  # only the first prominent occurrence for this mark
+    # Only flagged occurrences come back: the term occurs in prominent text AND the symbol is wrong/missing.
+    for hit in hits:
+        mark = marks[hit["mark_idx"]]
+        findings.append(
+            {
+                "url": url, "term": mark["term"], "issue": hit["status"],
+                "expected": mark["symbol"], "found": hit["actual_symbol"],
+                "path": hit["path"], "snippet": hit["snippet"], "details": "",
+            }
+        )
+    page_has_issue = bool(findings)
 
     # Screenshots are controlled by the flag; you’ve turned it off in the workflow
     if save_screenshot and page_has_issue:
         ts = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
         safe = url.replace("://", "__").replace("/", "_")
-        filepath = os.path.join(out_dir, f"{safe}_{ts}.png")
+        filepath = os.path.join(out_dir, f"{safe}_{ts}.jpg")
         try:
-            await page.screenshot(path=filepath, full_page=True)
+            # Clip to the flagged element; only fall back to the full page if it can't be located.
+            clip = await flagged_element_clip(page)
+            if clip:
+                await page.screenshot(path=filepath, type="jpeg", quality=70, clip=clip)
+            else:
+                await page.screenshot(path=filepath, type="jpeg", quality=70, full_page=True)
         except Exception:
             pass
 
@@ -249,7 +341,7 @@ async def process_url(
 
 
 # -----------------------------
-# Runner with per-worker pages + progress
+# Runner with a persistent context + per-worker pages + progress
 # -----------------------------
 async def run_audit(
     urls: List[str],
@@ -258,61 +350,176 @@ async def run_audit(
     concurrency: int,
     rps: float,
     save_screenshots: bool,
-) -> List[Dict[str, Any]]:
+    user_data_dir: str = ".pw-cache",
+    findings_name: str = "findings.jsonl",
+    label: str = "audit",
+) -> None:
+    """Audit all URLs, streaming each page's findings to findings_name in out_dir."""
     os.makedirs(out_dir, exist_ok=True)
-    findings_all: List[Dict[str, Any]] = []
-
-    q: asyncio.Queue[str] = asyncio.Queue()
-    for u in urls:
-        q.put_nowait(u)
 
     completed = 0
-    total = q.qsize()
+    total = len(urls)
+    num_workers = max(1, min(concurrency, total))
     lock = asyncio.Lock()
 
-    async with async_playwright() as p:
-        browser: Browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context()
-
-        async def worker(worker_id: int):
-            nonlocal completed
-            page = await context.new_page()
+    # Bounded queue fed by a producer; None is the per-worker stop sentinel.
+    q: asyncio.Queue[Optional[str]] = asyncio.Queue(maxsize=num_workers * 2)
+
+    async def producer():
+        for u in urls:
+            await q.put(u)
+        for _ in range(num_workers):
+            await q.put(None)
+
+    # One token bucket shared by all workers enforces --rps globally. A bucket of
+    # one request per 1/rps seconds also handles fractional rates (e.g. 0.5).
+    limiter = AsyncLimiter(1, 1.0 / rps) if rps > 0 else None
+
+    # Images are never inspected, but screenshots of flagged pages need them.
+    # (Blocked via Blink settings: Playwright request routing disables the HTTP cache.)
+    launch_args = ["--disable-dev-shm-usage"]
+    if not save_screenshots:
+        launch_args.append("--blink-settings=imagesEnabled=false")
+
+    with open(Path(out_dir) / findings_name, "wb") as findings_file:
+        async with async_playwright() as p:
+            # A persistent profile keeps Chromium's disk cache warm across runs,
+            # so repeat audits of the same site skip re-downloading JS/CSS.
+            context: BrowserContext = await p.chromium.launch_persistent_context(
+                user_data_dir, headless=True, args=launch_args
+            )
+            await context.add_init_script(script=COLLECTOR_SCRIPT)
+
+            async def worker(worker_id: int):
+                nonlocal completed
+                page = await context.new_page()
+                try:
+                    while True:
+                        url = await q.get()
+                        if url is None:
+                            q.task_done()
+                            break
+
+                        if limiter is not None:
+                            await limiter.acquire()
+
+                        result = await process_url(page, url, marks, save_screenshots, out_dir)
+
+                        # ---- Stream findings + visible progress ----
+                        async with lock:
+                            for r in result:
+                                try:
+                                    findings_file.write(jsonl_line(r))
+                                except (TypeError, ValueError) as exc:
+                                    print(f"[{label}] skipped unencodable finding for {url}: {exc}", flush=True)
+                            completed += 1
+                            if completed % 5 == 0 or completed == total:
+                                print(f"[{label}] {completed}/{total} URLs processed", flush=True)
+
+                        q.task_done()
+                finally:
+                    await page.close()
+
+            workers = [asyncio.create_task(worker(i)) for i in range(num_workers)]
             try:
-                while True:
-                    try:
-                        url = q.get_nowait()
-                    except asyncio.QueueEmpty:
-                        break
+                await asyncio.gather(producer(), *workers)
+            finally:
+                await context.close()
 
-                    if rps > 0:
-                        await asyncio.sleep(1.0 / rps)
 
-                    result = await process_url(page, url, marks, save_screenshots, out_dir)
-                    findings_all.extend(result)
+# -----------------------------
+# Multi-process runner
+# -----------------------------
+AuditJob = Tuple[int, List[str], List[Dict[str, Any]], str, int, float, bool, str]
+
 
-                    # ---- Visible progress ----
-                    async with lock:
-                        completed += 1
-                        if completed % 5 == 0 or completed == total:
-                            print(f"[audit] {completed}/{total} URLs processed", flush=True)
+def _worker_entry(job: AuditJob) -> str:
+    """Run one process's share of the audit; returns its findings part file name."""
+    index, urls, marks, out_dir, concurrency, rps, save_screenshots, user_data_dir = job
+    part_name = f"findings.part{index}.jsonl"
+    asyncio.run(
+        run_audit(
+            urls=urls,
+            marks=marks,
+            out_dir=out_dir,
+            concurrency=concurrency,
+            rps=rps,
+            save_screenshots=save_screenshots,
+            # Chromium locks its profile, so each process gets its own.
+            user_data_dir=os.path.join(user_data_dir, f"p{index}"),
+            findings_name=part_name,
+            label=f"audit p{index}",
+        )
+    )
+    return part_name
 
-                    q.task_done()
-            finally:
-                await page.close()
 
-        num_workers = max(1, min(concurrency, total))
-        workers = [asyncio.create_task(worker(i)) for i in range(num_workers)]
-        await asyncio.gather(*workers)
-        await context.close()
-        await browser.close()
+def run_audit_processes(
+    urls: List[str],
+    marks: List[Dict[str, Any]],
+    out_dir: str,
+    processes: int,
+    concurrency: int,
+    rps: float,
+    save_screenshots: bool,
+    user_data_dir: str = ".pw-cache",
+) -> None:
+    """
+    Split URLs across processes, each driving its own Chromium + event loop,
+    then merge their findings into findings.jsonl. Concurrency and rps are
+    totals and are divided between the processes that actually run.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    # Never more processes than pages or URLs, so every process gets >= 1 of each.
+    processes = max(1, min(processes, concurrency, len(urls)))
+    base, extra = divmod(max(1, concurrency), processes)
+    jobs: List[AuditJob] = [
+        (i, urls[i::processes], marks, out_dir, base + (1 if i < extra else 0), rps / processes,
+         save_screenshots, user_data_dir)
+        for i in range(processes)
+    ]
+    with multiprocessing.get_context("spawn").Pool(len(jobs)) as pool:
+        part_names = pool.map(_worker_entry, jobs)
 
-    return findings_all
+    out = Path(out_dir)
+    with open(out / "findings.jsonl", "wb") as merged:
+        for name in part_names:
+            with open(out / name, "rb") as part:
+                shutil.copyfileobj(part, merged)
+            os.remove(out / name)
 
 
 # -----------------------------
 # Outputs
 # -----------------------------
-def render_html_report(rows: List[Dict[str, Any]]) -> str:
+FIELDS = ["url", "term", "issue", "expected", "found", "path", "snippet", "details"]
+
+
+def jsonl_line(row: Dict[str, Any]) -> bytes:
+    """
+    Encode one finding as a UTF-8 JSON Lines record. Text orjson rejects
+    (e.g. lone surrogates from page content) is re-encoded with stdlib json,
+    replacing unencodable characters.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(row) + b"\n"
+        except TypeError:
+            pass
+    return (json.dumps(row, ensure_ascii=False) + "\n").encode("utf-8", errors="replace")
+
+
+def iter_findings(jsonl_path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield finding rows from a findings.jsonl file one at a time."""
+    loads = orjson.loads if orjson is not None else json.loads
+    with open(jsonl_path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
+def render_html_report(rows: Iterable[Dict[str, Any]], fh: TextIO) -> None:
+    """Write the HTML report to fh one row at a time."""
     head = """<!doctype html>
 <html><head><meta charset="utf-8">
 <title>Vitamix Trademark Audit — Report</title>
@@ -333,55 +540,44 @@ body{font-family:system-ui,Segoe UI,Roboto,Helvetica,Arial,sans-serif;margin:24p
   <th>URL</th><th>Term</th><th>Issue</th><th>Expected</th><th>Found</th><th>Path</th><th>Snippet</th>
 </tr></thead><tbody>
 """
-    body_parts = []
+    fh.write(head)
+    esc = html_escape
     for r in rows:
+        issue = r.get("issue", "")
         cls = (
-            "issue-missing" if r.get("issue") == "missing symbol"
-            else "issue-wrong" if r.get("issue") == "wrong symbol"
-            else "issue-notfound" if r.get("issue") == "not found in prominent text"
+            "issue-missing" if issue == "missing symbol"
+            else "issue-wrong" if issue == "wrong symbol"
+            else "issue-notfound" if issue == "not found in prominent text"
             else ""
         )
-        body_parts.append(
-            "<tr class=\"%s\"><td class=\"url\"><a href=\"%s\" target=\"_blank\">%s</a></td>"
-            "<td>%s</td><td>%s</td><td>%s</td><td>%s</td>"
-            "<td><code>%s</code></td><td class=\"snip\">%s</td></tr>"
-            % (
-                cls,
-                html_escape(r.get("url", "")),
-                html_escape(r.get("url", "")),
-                html_escape(r.get("term", "")),
-                html_escape(r.get("issue", "")),
-                html_escape(r.get("expected", "")),
-                html_escape(r.get("found", "")),
-                html_escape((r.get("path") or "")[:140]),
-                html_escape(r.get("snippet", "")),
-            )
+        url = esc(r.get("url", ""))
+        fh.write(
+            f'<tr class="{cls}"><td class="url"><a href="{url}" target="_blank">{url}</a></td>'
+            f'<td>{esc(r.get("term", ""))}</td><td>{esc(issue)}</td>'
+            f'<td>{esc(r.get("expected", ""))}</td><td>{esc(r.get("found", ""))}</td>'
+            f'<td><code>{esc((r.get("path") or "")[:140])}</code></td>'
+            f'<td class="snip">{esc(r.get("snippet", ""))}</td></tr>\n'
         )
 
-    tail = """
-</tbody></table>
+    fh.write("""</tbody></table>
 </body></html>
-"""
-    return head + "\n".join(body_parts) + tail
+""")
 
 
-def write_outputs(findings: List[Dict[str, Any]], out_dir: str):
+def write_outputs(out_dir: str):
+    """Derive findings.csv and report.html from the streamed findings.jsonl."""
     out = Path(out_dir)
-    out.mkdir(parents=True, exist_ok=True)
-
-    rows = findings  # already dicts
+    jsonl_path = out / "findings.jsonl"
 
     # CSV
-    pd.DataFrame(rows).to_csv(out / "findings.csv", index=False)
-
-    # JSONL
-    with open(out / "findings.jsonl", "w", encoding="utf-8") as f:
-        for r in rows:
-            f.write(json.dumps(r, ensure_ascii=False) + "\n")
+    with open(out / "findings.csv", "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(iter_findings(jsonl_path))
 
     # HTML
-    html = render_html_report(rows)
-    (out / "report.html").write_text(html, encoding="utf-8")
+    with open(out / "report.html", "w", encoding="utf-8") as fh:
+        render_html_report(iter_findings(jsonl_path), fh)
 
 
 # -----------------------------
@@ -395,22 +591,37 @@ def main() -> None:
     parser.add_argument("--concurrency", type=int, default=4, help="Number of concurrent pages to use")
     parser.add_argument("--rps", type=float, default=2.0, help="Maximum requests per second (polite rate)")
     parser.add_argument("--save-flagged-screenshots", action="store_true", help="Save screenshots for pages with findings")
+    parser.add_argument("--processes", type=int, default=1, help="Browser processes to split URLs across, capped at --concurrency and the URL count (concurrency and rps are shared between them)")
+    parser.add_argument("--user-data-dir", default=".pw-cache", help="Chromium profile directory reused across runs (warm HTTP cache)")
     args = parser.parse_args()
 
     urls = read_urls(args.urls_file)
     marks = read_marks(args.marks_file)
 
-    findings = asyncio.run(
-        run_audit(
+    if args.processes > 1 and len(urls) > 1:
+        run_audit_processes(
             urls=urls,
             marks=marks,
             out_dir=args.out,
+            processes=args.processes,
             concurrency=args.concurrency,
             rps=args.rps,
             save_screenshots=args.save_flagged_screenshots,
+            user_data_dir=args.user_data_dir,
         )
-    )
-    write_outputs(findings, args.out)
+    else:
+        asyncio.run(
+            run_audit(
+                urls=urls,
+                marks=marks,
+                out_dir=args.out,
+                concurrency=args.concurrency,
+                rps=args.rps,
+                save_screenshots=args.save_flagged_screenshots,
+                user_data_dir=args.user_data_dir,
+            )
+        )
+    write_outputs(args.out)
 
 
 if __name__ == "__main__":